@@ -2,7 +2,33 @@
 
 from __future__ import annotations
 
-from sugar.cli import run_app
+import sys
+
+
+def _is_version_call(argv: list[str]) -> bool:
+    """Check if the CLI was called just to show the sugar version."""
+    for arg in argv[1:]:
+        if arg in ('--version', '-v'):
+            return True
+        if not arg.startswith('-'):
+            # a flag value or a command, let the CLI handle it
+            return False
+    return False
+
+
+def run_app() -> None:
+    """Run the sugar app, skipping the CLI setup for `--version`."""
+    if _is_version_call(sys.argv):
+        from sugar import __version__
+        from sugar.logs import SugarLogs
+
+        SugarLogs.print_info(f'Sugar version: {__version__}')
+        return
+
+    from sugar.cli import run_app as run_cli_app
+
+    run_cli_app()
+
 
 if __name__ == '__main__':
     run_app()
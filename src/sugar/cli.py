@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import functools
+import inspect
 import os
 import sys
 
-from pathlib import Path
 from typing import Any, Callable, Dict, Optional, Type, Union, cast
 
 import click
@@ -15,8 +16,9 @@ from typer import Option
 
 from sugar import __version__
 from sugar.core import extensions
-from sugar.docs import MetaDocs, MetaDocsParams
-from sugar.logs import SugarLogs
+from sugar.docs import DecoratedMetaDocsFunction, MetaDocs
+from sugar.extensions.base import SugarBase
+from sugar.logs import SugarExit, SugarLogs
 
 # "count" means the number of parameters expected for each flag
 CLI_ROOT_FLAGS_VALUES_COUNT = {
@@ -28,26 +30,33 @@ CLI_ROOT_FLAGS_VALUES_COUNT = {
     '--version': 0,  # not necessary to store this value
 }
 
-flags_state: dict[str, bool] = {
-    'verbose': False,
+TYPES_MAPPING: dict[str, Type[Union[str, int, float, bool]]] = {
+    'str': str,
+    'string': str,
+    'int': int,
+    'integer': int,
+    'float': float,
+    'bool': bool,
+    'boolean': bool,
 }
 
-flags_group: dict[str, str] = {
-    'group': '',
+TYPES_NAMES_MAPPING = {
+    'str': 'str',
+    'string': 'str',
+    'int': 'int',
+    'integer': 'int',
+    'float': 'float',
+    'bool': 'bool',
+    'boolean': 'bool',
+    # Add more mappings as needed
 }
 
-flags_dry_run: dict[str, bool] = {
-    'dry_run': False,
-}
+DASH_TO_UNDERSCORE = str.maketrans('-', '_')
 
-opt_state: dict[str, list[Any]] = {
-    'options': [],
-    'cmd': [],
-}
+root_state: dict[str, str | bool] = {}
 
-sugar_exts = {
-    ext_name: ext_class() for ext_name, ext_class in extensions.items()
-}
+# note: the extensions are instantiated on first use (`get_sugar_ext`)
+sugar_exts: dict[str, SugarBase] = {}
 
 typer_groups: dict[str, typer.Typer] = {}
 
@@ -67,7 +76,38 @@ app = typer.Typer(
 
 
 def _check_sugar_file(file_path: str = '.sugar.yaml') -> bool:
-    return Path(file_path).exists()
+    return os.path.exists(file_path)
+
+
+def get_sugar_ext(ext_name: str) -> SugarBase:
+    """Return the instance of the given extension, creating it if needed."""
+    sugar_ext = sugar_exts.get(ext_name)
+    if sugar_ext is None:
+        sugar_ext = sugar_exts[ext_name] = extensions[ext_name]()
+    return sugar_ext
+
+
+def load_sugar_ext(ext_name: str) -> SugarBase:
+    """
+    Load the sugar configuration for the given extension.
+
+    Just the extension invoked by the CLI is loaded, so the config file is
+    not parsed for the other ones.
+    """
+    sugar_ext = get_sugar_ext(ext_name)
+    sugar_ext.load(
+        file=cast(str, root_state.get('file', '.sugar.yaml')),
+        group=cast(str, root_state.get('group', '')),
+        dry_run=cast(bool, root_state.get('dry_run', False)),
+        verbose=cast(bool, root_state.get('verbose', False)),
+    )
+    return sugar_ext
+
+
+def run_sugar_command(ext_name: str, action: str, **kwargs: Any) -> None:
+    """Load the given extension and run the command for the action."""
+    sugar_ext = load_sugar_ext(ext_name)
+    sugar_ext.actions_dispatch[action](sugar_ext, **kwargs)
 
 
 def version_callback() -> None:
@@ -118,17 +158,13 @@ def main(
     """
     ctx.ensure_object(dict)
 
-    if verbose:
-        # global
-        flags_state['verbose'] = True
-
-    if group:
-        # global
-        flags_group['group'] = group
+    if version:
+        version_callback()
+        raise typer.Exit()
 
-    if dry_run:
-        # global
-        flags_dry_run['dry_run'] = True
+    # note: `file`, `group`, `verbose` and `dry_run` are declared here for
+    #       the parsing and the help; their values are read from the argv
+    #       in `run_app` (`root_state`) before the app runs
 
     if ctx.invoked_subcommand is None:
         raise typer.Exit()
@@ -148,16 +184,7 @@ def map_type_from_string(type_name: str) -> Type[Union[str, int, float, bool]]:
     type
         The corresponding Python type.
     """
-    type_mapping = {
-        'str': str,
-        'string': str,
-        'int': int,
-        'integer': int,
-        'float': float,
-        'bool': bool,
-        'boolean': bool,
-    }
-    return type_mapping.get(type_name, str)
+    return TYPES_MAPPING.get(type_name, str)
 
 
 def normalize_string_type(type_name: str) -> str:
@@ -174,17 +201,7 @@ def normalize_string_type(type_name: str) -> str:
     str
         The corresponding makim type name.
     """
-    type_mapping = {
-        'str': 'str',
-        'string': 'str',
-        'int': 'int',
-        'integer': 'int',
-        'float': 'float',
-        'bool': 'bool',
-        'boolean': 'bool',
-        # Add more mappings as needed
-    }
-    return type_mapping.get(type_name, 'str')
+    return TYPES_NAMES_MAPPING.get(type_name, 'str')
 
 
 def get_default_value(
@@ -202,54 +219,52 @@ def get_default_value(
     return None
 
 
-def get_default_value_str(arg_type: str, value: Any) -> str:
-    """Return the default value regarding its type in a string format."""
+def get_option_default(
+    arg_type: str, value: Any
+) -> Union[str, int, float, bool]:
+    """Return the default value of a command option regarding its type."""
     if arg_type == 'str':
-        return f'"{value}"'
+        return str(value)
 
     if arg_type == 'bool':
-        return 'False'
+        return False
 
-    return f'{value or 0}'
+    return map_type_from_string(arg_type)(value or 0)
 
 
-def create_args_string(args: dict[str, dict[str, str]]) -> str:
-    """Return a string for arguments for a function for typer."""
-    args_rendered = []
+def create_args_parameters(
+    args: dict[str, dict[str, str]],
+    args_names: dict[str, str],
+) -> list[inspect.Parameter]:
+    """Return the parameters of a typer command function for the args."""
+    parameters = []
 
-    arg_template = (
-        '{arg_name}: Optional[{arg_type}] = typer.Option('
-        '{default_value}, '
-        '"--{name_flag}", '
-        'help="{help_text}"'
-        ')'
-    )
-
-    for name, spec in args.items():
-        name_clean = name.replace('-', '_')
+    for param_name, name in args_names.items():
+        spec = args[name]
         arg_type = normalize_string_type(spec.get('type', 'str'))
-        help_text = spec.get('help', '')
-        default_value = 'None'
+        default_value: Optional[Union[str, int, float, bool]] = None
 
         if not spec.get('required', False) and not spec.get(
             'interactive', False
         ):
-            default_value = spec.get('default', '')
-            default_value = get_default_value_str(arg_type, default_value)
-
-        arg_str = arg_template.format(
-            **{
-                'arg_name': name_clean,
-                'arg_type': arg_type,
-                'default_value': default_value,
-                'name_flag': name,
-                'help_text': help_text.replace('\n', '\\n'),
-            }
-        )
+            default_value = get_option_default(
+                arg_type, spec.get('default', '')
+            )
 
-        args_rendered.append(arg_str)
+        parameters.append(
+            inspect.Parameter(
+                param_name,
+                inspect.Parameter.KEYWORD_ONLY,
+                default=typer.Option(
+                    default_value,
+                    f'--{name}',
+                    help=spec.get('help', ''),
+                ),
+                annotation=Optional[map_type_from_string(arg_type)],
+            )
+        )
 
-    return ', '.join(args_rendered)
+    return parameters
 
 
 def apply_click_options(
@@ -322,32 +337,20 @@ def create_dynamic_command(
     args = cast(Dict[str, Dict[str, str]], meta.get('parameters', {}))
     fn_help = cast(str, meta.get('title', ''))
 
-    args_str = create_args_string(args)
-    args_param_list: list[str] = []
-
-    for arg, arg_details in args.items():
-        arg_clean = arg.replace('-', '_')
-        args_param_list.append(f'{arg}={arg_clean}')
-
-    args_param_str = ','.join(args_param_list)
+    # map the python name of each parameter to the argument name
+    args_names = {arg.translate(DASH_TO_UNDERSCORE): arg for arg in args}
 
-    decorator = typer_group.command(
-        name,
-        help=fn_help,
-    )
-
-    function_code = f'def dynamic_command({args_str}):\n'
-
-    # handle interactive prompts
-    for arg, arg_details in args.items():
-        arg_clean = arg.replace('-', '_')
-
-    function_code += f'    sugar = sugar_exts.get("{ext_name}")\n'
-    function_code += f'    sugar._cmd_{name}({args_param_str})\n'
+    def dynamic_command(**kwargs: Any) -> None:
+        run_sugar_command(
+            ext_name,
+            name,
+            **{args_names[key]: value for key, value in kwargs.items()},
+        )
 
-    local_vars: dict[str, Any] = {}
-    exec(function_code, globals(), local_vars)
-    dynamic_command = decorator(local_vars['dynamic_command'])
+    # note: typer reads the command options from the signature
+    signature = inspect.Signature(create_args_parameters(args, args_names))
+    dynamic_command.__signature__ = signature  # type: ignore[attr-defined]
+    dynamic_command = typer_group.command(name, help=fn_help)(dynamic_command)
 
     # Apply Click options to the Typer command
     if 'args' in args:
@@ -355,211 +358,137 @@ def create_dynamic_command(
         dynamic_command = apply_click_options(dynamic_command, options_data)
 
 
-def extract_options_and_cmd_args() -> tuple[list[str], list[str]]:
-    """Extract arg `options` and `cmd` from the CLI calling."""
-    args = list(sys.argv)
-    total_args = len(args)
-
-    if '--options' in args:
-        options_sep_idx = args.index('--options')
-    else:
-        options_sep_idx = None
-
-    if '--cmd' in args:
-        cmd_sep_idx = args.index('--cmd')
-    else:
-        cmd_sep_idx = None
-
-    if options_sep_idx is None and cmd_sep_idx is None:
-        return [], []
-
-    # check if --options or --cmd are the last ones in the command line
-    first_sep_idx = min(
-        [(options_sep_idx or total_args), (cmd_sep_idx or total_args)]
-    )
-    for sugar_arg in [
-        '--verbose',
-        '--version',
-        '--group',
-        '--services',
-        '--service',
-        '--all',
-        '--file',
-    ]:
-        if sugar_arg not in args:
-            continue
-
-        if first_sep_idx < args.index(sugar_arg):
-            print(
-                '[EE] The parameters --options/--cmd should be the '
-                'last ones in the command line.'
-            )
-            os._exit(1)
-
-    for ind in range(first_sep_idx, total_args):
-        sys.argv.pop(first_sep_idx)
-
-    options_sep_idx = options_sep_idx or total_args
-    cmd_sep_idx = cmd_sep_idx or total_args
-
-    if options_sep_idx < cmd_sep_idx:
-        options_args = args[options_sep_idx + 1 : cmd_sep_idx]
-        cmd_args = args[cmd_sep_idx + 1 :]
-    else:
-        cmd_args = args[cmd_sep_idx + 1 : options_sep_idx]
-        options_args = args[options_sep_idx + 1 :]
-    return options_args, cmd_args
-
-
-def extract_root_config(
-    cli_list: list[str] = sys.argv,
-) -> dict[str, str | bool]:
-    """Extract the root configuration from the CLI."""
-    params = cli_list[1:]
+@functools.lru_cache(maxsize=8)
+def _parse_root_cli(
+    params: tuple[str, ...],
+) -> tuple[dict[str, str | bool], str]:
+    """
+    Parse the root flags and the first command from the CLI params.
 
+    This function is based on `CLI_ROOT_FLAGS_VALUES_COUNT`.
+    """
     # default values
     sugar_file = '.sugar.yaml'
     group = ''
     dry_run = False
     verbose = False
+    command = ''
 
-    try:
-        idx = 0
-        while idx < len(params):
-            arg = params[idx]
-            if arg not in CLI_ROOT_FLAGS_VALUES_COUNT:
-                break
-
-            if arg == '--file':
-                try:
-                    sugar_file = params[idx + 1]
-                except IndexError:
-                    pass
-            elif arg == '--group':
-                try:
-                    group = params[idx + 1]
-                except IndexError:
-                    pass
-            elif arg == '--dry-run':
-                dry_run = True
-            elif arg == '--verbose':
-                verbose = True
-
-            idx += 1 + CLI_ROOT_FLAGS_VALUES_COUNT[arg]
-    except Exception:
-        red_text = typer.style(
-            'The sugar config file was not correctly detected. '
-            'Using the default .sugar.yaml.',
-            fg=typer.colors.RED,
-            bold=True,
-        )
-        typer.echo(red_text, err=True, color=True)
+    idx = 0
+    total_params = len(params)
+    while idx < total_params:
+        arg = params[idx]
+        values_count = CLI_ROOT_FLAGS_VALUES_COUNT.get(arg)
 
-    return {
+        if values_count is None:
+            command = f'flag `{arg}`' if arg.startswith('--') else arg
+            break
+
+        if arg == '--file' and idx + 1 < total_params:
+            sugar_file = params[idx + 1]
+        elif arg == '--group' and idx + 1 < total_params:
+            group = params[idx + 1]
+        elif arg == '--dry-run':
+            dry_run = True
+        elif arg == '--verbose':
+            verbose = True
+
+        idx += 1 + values_count
+
+    root_config: dict[str, str | bool] = {
         'file': sugar_file,
         'group': group,
         'dry_run': dry_run,
         'verbose': verbose,
     }
+    return root_config, command
 
 
-def _get_command_from_cli() -> str:
-    """
-    Get the group and task from CLI.
-
-    This function is based on `CLI_ROOT_FLAGS_VALUES_COUNT`.
-    """
-    params = sys.argv[1:]
-    command = ''
+def extract_root_config(
+    cli_list: Optional[list[str]] = None,
+) -> dict[str, str | bool]:
+    """Extract the root configuration from the CLI."""
+    if cli_list is None:
+        cli_list = sys.argv
 
-    try:
-        idx = 0
-        while idx < len(params):
-            arg = params[idx]
-            if arg not in CLI_ROOT_FLAGS_VALUES_COUNT:
-                command = f'flag `{arg}`' if arg.startswith('--') else arg
-                break
+    root_config, _ = _parse_root_cli(tuple(cli_list[1:]))
+    # note: the parsed result is cached, so it is not given to the caller
+    return dict(root_config)
 
-            idx += 1 + CLI_ROOT_FLAGS_VALUES_COUNT[arg]
-    except Exception as e:
-        print(e)
 
+def _get_command_from_cli() -> str:
+    """Get the group and task from CLI."""
+    _, command = _parse_root_cli(tuple(sys.argv[1:]))
     return command
 
 
+def _get_extension_from_cli() -> str:
+    """Get the extension invoked from CLI, if any."""
+    command = _get_command_from_cli()
+    return command if command in extensions else ''
+
+
 def run_app() -> None:
     """Run the typer app."""
     root_config = extract_root_config()
 
     config_file_path = cast(str, root_config.get('file', '.sugar.yaml'))
 
-    cli_completion_words = [
-        w for w in os.getenv('COMP_WORDS', '').split('\n') if w
-    ]
+    # note: COMP_WORDS is just set by the shell completion
+    completion_words = os.environ.get('COMP_WORDS')
 
-    if not _check_sugar_file(config_file_path) and cli_completion_words:
+    if completion_words and not _check_sugar_file(config_file_path):
         # autocomplete call
+        cli_completion_words = [w for w in completion_words.split('\n') if w]
         root_config = extract_root_config(cli_completion_words)
         config_file_path = cast(str, root_config.get('file', '.sugar.yaml'))
         if not _check_sugar_file(config_file_path):
             return
 
-    for sugar_ext in sugar_exts.values():
-        sugar_ext.load(
-            file=config_file_path,
-            group=cast(str, root_config.get('group', '')),
-            dry_run=cast(bool, root_config.get('dry_run', False)),
-            verbose=cast(bool, root_config.get('verbose', False)),
-        )
-
-    commands: dict[str, list[MetaDocs]] = {}
-    actions: list[str] = []
-
-    for ext_name, ext_class in extensions.items():
-        ext_obj = ext_class()
-        commands[ext_name] = []
-
-        actions = ext_obj.actions
-
-        for action in actions:
-            fn_name = f'_cmd_{action}'
-            fn = getattr(ext_obj, fn_name)
-            title = fn._meta_docs.get('title', '')
-
-            commands[ext_name].append(
-                cast(
-                    MetaDocs,
-                    {
-                        'name': action,
-                        'title': title,
-                        'parameters': cast(
-                            MetaDocsParams, fn._meta_docs.get('parameters', {})
-                        ),
-                    },
-                )
-            )
+    # the extension is loaded just when its command is executed
+    root_state.update(root_config)
+    root_state['file'] = config_file_path
 
-    # Add dynamically created commands to Typer app
-    for ext_name, actions_meta in commands.items():
-        ext_obj = extensions[ext_name]()
+    # when an extension is invoked, just its commands are created,
+    # otherwise (e.g. --help) all of them are needed
+    ext_invoked = _get_extension_from_cli()
+    exts_selected = (
+        {ext_invoked: extensions[ext_invoked]} if ext_invoked else extensions
+    )
 
-        if not ext_obj:
-            SugarLogs.raise_error(f'Extension not found ({ext_name}).')
+    # note: the commands metadata is read from the extension classes, so
+    #       no extension is instantiated to build the CLI
+    for ext_name, ext_class in exts_selected.items():
+        if ext_name in typer_groups:
+            # already registered by a previous call (e.g. tests)
+            continue
 
         typer_group = typer.Typer(
-            help=ext_obj.__doc__,
+            help=ext_class.__doc__,
             invoke_without_command=True,
         )
         typer_groups[ext_name] = typer_group
 
-        for action_meta in actions_meta:
+        for action in ext_class.actions:
+            fn = cast(
+                DecoratedMetaDocsFunction, ext_class.actions_dispatch[action]
+            )
+            meta_docs = fn._meta_docs
+
+            action_meta: MetaDocs = {
+                'name': action,
+                'title': meta_docs.get('title', ''),
+                'parameters': meta_docs.get('parameters', {}),
+            }
             create_dynamic_command(ext_name, typer_group, action_meta)
 
-    for ext_name, typer_group in typer_groups.items():
         app.add_typer(typer_group, name=ext_name, rich_help_panel='COMMAND')
 
     try:
         app()
+    except SugarExit:
+        # error already reported by the extension
+        raise
     except SystemExit as e:
         # code 2 means code not found
         error_code = 2
@@ -570,7 +499,3 @@ def run_app() -> None:
         typer.secho(f'Command {command_used} not found.', fg='red')
 
         raise e
-
-
-if __name__ == '__main__':
-    run_app()
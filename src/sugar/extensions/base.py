@@ -2,70 +2,156 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import io
 import json
 import os
 import shlex
+import shutil
 import sys
-import tempfile
 
+from collections import OrderedDict
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Union
-
-import dotenv
-import sh
-import yaml
-
-from jinja2 import Environment
-from jsonschema import ValidationError, validate
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Union
 
 from sugar import __version__
 from sugar.logs import SugarError, SugarLogs
 from sugar.utils import camel_to_snake
 
-TEMPLATE = Environment(
-    autoescape=False,
-    variable_start_string='${{',
-    variable_end_string='}}',
-)
+if TYPE_CHECKING:
+    import sh
+
+    from jinja2 import Environment
 
 SUGAR_CURRENT_PATH = Path(__file__).parent.parent
 
+CONFIG_CACHE_MAXSIZE = 32
+
+SEPARATOR_LINE = '-' * 80
+
+_config_cache: OrderedDict[tuple[str, int, int], Any] = OrderedDict()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_backend_command(name: str) -> sh.Command:
+    """Return the `sh` command for the backend (resolved once)."""
+    import sh
+
+    backend_path = shutil.which(name)
+
+    if backend_path is None:
+        SugarLogs.raise_error(
+            f'The backend command `{name}` was not found.',
+            SugarError.SUGAR_COMPOSE_APP_NOT_FOUNDED,
+        )
+
+    return sh.Command(backend_path)
+
+
+@functools.lru_cache(maxsize=None)
+def get_template_env() -> Environment:
+    """Return the jinja2 environment used to render the config values."""
+    from jinja2 import Environment
+
+    return Environment(
+        autoescape=False,
+        variable_start_string='${{',
+        variable_end_string='}}',
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_yaml_loader() -> Any:
+    """Return the YAML safe loader, using the libyaml one if available."""
+    import yaml
+
+    return getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def _intern_keys(data: Any) -> Any:
+    """Return a copy of the data with all the string keys interned."""
+    if isinstance(data, dict):
+        return {
+            sys.intern(k) if isinstance(k, str) else k: _intern_keys(v)
+            for k, v in data.items()
+        }
+    if isinstance(data, list):
+        return [_intern_keys(v) for v in data]
+    return data
+
+
+def read_config_file(file_path: str) -> Any:
+    """
+    Return the parsed content of the given sugar config file.
+
+    The parsed content is cached by path, mtime and size, so a file is
+    parsed again only if it was changed.
+    """
+    stat = os.stat(file_path)
+    abs_path = os.path.abspath(file_path)
+    key = (abs_path, stat.st_mtime_ns, stat.st_size)
+
+    if key in _config_cache:
+        _config_cache.move_to_end(key)
+    else:
+        import yaml
+
+        with open(file_path, 'rb') as f:
+            data = yaml.load(f, Loader=get_yaml_loader())  # nosec B506
+
+        # note: the config keys are repeated a lot and used for lookups
+        _config_cache[key] = _intern_keys(data)
+        if len(_config_cache) > CONFIG_CACHE_MAXSIZE:
+            _config_cache.popitem(last=False)
+
+    # note: the config is changed in place when it is loaded
+    return deepcopy(_config_cache[key])
+
 
 class SugarBase:
     """SugarBase defined the base structure for the Sugar classes."""
 
-    actions: list[str] = []
-    args: dict[str, str] = {}
-    file: str = ''
-    config: dict[str, Any] = {}
-    # note: it starts with a simple command
-    #       it is replaced later in the execution
-    backend_app: sh.Command = sh.echo
-    backend_args: list[str] = []
-    defaults: dict[str, Any] = {}
-    dry_run: bool = False
-    env: dict[str, str] = {}
-    options_args: list[str] = []
-    cmd_args: list[str] = []
-    service_group: dict[str, Any] = {}
-    service_names: list[str] = []
-    group_selected: str = ''
-    verbose: bool = False
-    hooks: dict[str, list[dict[str, Any]]] = {}
+    actions: ClassVar[list[str]] = []
+    # map each action to the function that implements it
+    actions_dispatch: ClassVar[dict[str, Callable[..., Any]]] = {}
+
+    # note: the instance attributes are initialized in `__init__`, so
+    #       mutable values are never shared between instances
+    args: dict[str, str]
+    file: str
+    config: dict[str, Any]
+    # note: it is resolved later in the execution (`_load_backend_app`)
+    backend_app: sh.Command
+    backend_args: list[str]
+    defaults: dict[str, Any]
+    dry_run: bool
+    env: dict[str, str]
+    backend_env: dict[str, str]
+    options_args: list[str]
+    cmd_args: list[str]
+    service_group: dict[str, Any]
+    service_names: list[str]
+    group_selected: str
+    verbose: bool
+    hooks: dict[str, list[dict[str, Any]]]
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         """Initialize the actions list for all the created commands."""
         super().__init_subclass__(**kwargs)
-        # Ensure each subclass has its own actions list
-        cls.actions = cls.actions.copy()
+        # Ensure each subclass has its own actions table
+        cls.actions_dispatch = cls.actions_dispatch.copy()
         prefix = '_cmd_'
         prefix_len = len(prefix)
         for name, value in cls.__dict__.items():
             if callable(value) and name.startswith(prefix):
-                action_name = name[prefix_len:]
-                cls.actions.append(action_name)
+                # note: attribute names are already interned, the slice
+                #       is not
+                action_name = sys.intern(name[prefix_len:])
+                cls.actions_dispatch[action_name] = value
+        # note: overridden commands keep their original position
+        cls.actions = list(cls.actions_dispatch)
 
     def __init__(self) -> None:
         """Initialize SugarBase instance."""
@@ -79,9 +165,11 @@ class SugarBase:
         self.backend_args: list[str] = []
         self.defaults: dict[str, Any] = {}
         self.env: dict[str, str] = {}
+        self.backend_env: dict[str, str] = {}
         self.service_group: dict[str, Any] = {}
         self.service_names: list[str] = []
         self.group_selected: str = ''
+        self.hooks: dict[str, list[dict[str, Any]]] = {}
 
     def _setup_load(self, **kwargs: Any) -> None:
         """Set up the configuration for running the commands."""
@@ -89,10 +177,12 @@ class SugarBase:
         options_args: list[str] = kwargs.get('options_args', [])
         cmd_args: list[str] = kwargs.get('cmd_args', [])
 
-        self.args = deepcopy(args)
-        self.options_args = deepcopy(options_args)
+        # note: these are flat collections of strings, so a shallow copy
+        #       is enough
+        self.args = dict(args)
+        self.options_args = list(options_args)
         # note: it needs to be refactored
-        self.cmd_args = deepcopy(cmd_args)
+        self.cmd_args = list(cmd_args)
 
         self._load_config()
         self._load_env()
@@ -113,6 +203,8 @@ class SugarBase:
         _out: Union[io.TextIOWrapper, io.StringIO, Any] = sys.stdout,
         _err: Union[io.TextIOWrapper, io.StringIO, Any] = sys.stderr,
     ) -> None:
+        import sh
+
         # Execute pre-run hooks
         extension = camel_to_snake(
             self.__class__.__name__.replace('Sugar', '')
@@ -124,24 +216,26 @@ class SugarBase:
             '_out': _out,
             '_err': _err,
             '_no_err': True,
-            '_env': os.environ,
+            '_env': self.backend_env,
+            # note: the command runs in background just to keep its handle,
+            #       so the child can be stopped when sugar is interrupted
             '_bg': True,
             '_bg_exc': False,
         }
 
-        positional_parameters = [
+        positional_parameters = (
             *self.backend_args,
-            *[action],
+            action,
             *options_args,
             *services,
             *cmd_args,
-        ]
+        )
 
         if self.verbose or self.dry_run:
+            cmd_str = ' '.join(positional_parameters)
             SugarLogs.print_info(
-                f'>>> {self.backend_app} {" ".join(positional_parameters)}'
+                f'>>> {self.backend_app} {cmd_str}\n{SEPARATOR_LINE}'
             )
-            SugarLogs.print_info('-' * 80)
 
         if self.dry_run:
             SugarLogs.print_warning(
@@ -149,26 +243,25 @@ class SugarBase:
             )
             return
 
-        p = self.backend_app(
-            *positional_parameters,
-            **sh_extras,
-        )
+        process = self.backend_app(*positional_parameters, **sh_extras)
 
         try:
-            p.wait()
+            process.wait()
         except sh.ErrorReturnCode as e:
             SugarLogs.raise_error(str(e), SugarError.SH_ERROR_RETURN_CODE)
         except KeyboardInterrupt:
-            pid = p.pid
-            p.kill()
+            # SIGINT may reach just sugar (e.g. `kill -INT`), so the child is
+            # killed and reaped before exiting, never left running
+            pid = process.pid
+            with contextlib.suppress(ProcessLookupError):
+                process.kill()
+            with contextlib.suppress(sh.ErrorReturnCode):
+                process.wait()
             SugarLogs.raise_error(
                 f'Process {pid} killed.', SugarError.SH_KEYBOARD_INTERRUPT
             )
         self._execute_hooks('post-run', extension, action)
 
-    def _check_config_file(self) -> bool:
-        return Path(self.file).exists()
-
     # Check if services item is given
     def _check_services_item(self) -> bool:
         return hasattr(self.config, 'services')
@@ -177,26 +270,34 @@ class SugarBase:
         self, hook_type: str, extension: str, action: str
     ) -> None:
         """Execute hooks specific type, extension, and action."""
-        hooks = self.hooks.get(hook_type, [])
+        hooks = [
+            hook
+            for hook in self.hooks.get(hook_type, [])
+            if action in (hook.get('targets', {}).get(extension) or [])
+        ]
+
+        # most of the commands don't have hooks, so skip the setup
+        if not hooks:
+            return
+
+        import tempfile
+
+        import sh
 
         sh_extras = {
             '_in': sys.stdin,
             '_out': sys.stdout,
             '_err': sys.stderr,
             '_no_err': True,
-            '_env': os.environ,
+            '_env': self.backend_env,
         }
 
         fd, filepath = tempfile.mkstemp(suffix='sugar', text=True)
+        os.close(fd)
 
         for hook in hooks:
-            targets = hook.get('targets', {})
-            target_ext = targets.get(extension, [])
             hook_name = hook.get('name', '')
 
-            if not target_ext or action not in target_ext:
-                continue
-
             SugarLogs.print_info(f'Running {hook_type} hook: {hook_name} ...')
             cmd = hook.get('run', '').strip()
 
@@ -250,38 +351,39 @@ class SugarBase:
         # Verify if project-name is not null
         default_project_name = self.defaults.get('project-name', '') or ''
 
-        for group_name, group_data in groups.items():
-            if group_name == selected_group_name:
-                if default_project_name and 'project-name' not in group_data:
-                    # just use default value if "project-name" is not set
-                    group_data['project-name'] = default_project_name
-                if not group_data.get('services', {}).get('default'):
-                    # if default is not given or it is empty or null,
-                    # use as default all the services available
-                    default_services = [
-                        service['name']
-                        for service in group_data.get('services', {}).get(
-                            'available', []
-                        )
-                    ]
-                    group_data['services']['default'] = ','.join(
-                        default_services
-                    )
-                self.service_group = group_data
-                return
+        group_data = groups.get(selected_group_name)
 
-        SugarLogs.raise_error(
-            f'The given group service "{selected_group_name}" was not found '
-            'in the configuration file.',
-            SugarError.SUGAR_MISSING_PARAMETER,
-        )
+        if group_data is None:
+            SugarLogs.raise_error(
+                f'The given group service "{selected_group_name}" was not '
+                'found in the configuration file.',
+                SugarError.SUGAR_MISSING_PARAMETER,
+            )
+
+        if default_project_name and 'project-name' not in group_data:
+            # just use default value if "project-name" is not set
+            group_data['project-name'] = default_project_name
+        # names of all the available services, computed once
+        # and reused by the commands (e.g. for `--all`)
+        self.service_names = [
+            service['name']
+            for service in group_data.get('services', {}).get('available')
+            or []
+        ]
+        if not group_data.get('services', {}).get('default'):
+            # if default is not given or it is empty or null,
+            # use as default all the services available
+            group_data['services']['default'] = ','.join(self.service_names)
+        self.service_group = group_data
 
     def _load_config(self) -> None:
-        with open(self.file, 'r') as f:
-            # escape template tags
-            content = f.read()
-            f_content = io.StringIO(content)
-            self.config = yaml.safe_load(f_content)
+        try:
+            self.config = read_config_file(self.file)
+        except FileNotFoundError:
+            SugarLogs.raise_error(
+                f'Config file {self.file} not found.',
+                SugarError.SUGAR_CONFIG_FILE_NOT_FOUND,
+            )
 
         # check if either  services or  groups are present
         if not (self.config.get('services') or self.config.get('groups')):
@@ -312,8 +414,9 @@ class SugarBase:
                 SugarError.SUGAR_COMPOSE_APP_NOT_SUPPORTED,
             )
 
-        self.backend_app = sh.docker
-        self.backend_args.append(backend_cmd)
+        self.backend_app = _get_backend_command('docker')
+        # note: start from scratch, the instance can be loaded more than once
+        self.backend_args = [backend_cmd]
 
     def _load_backend_args(self) -> None:
         self._filter_service_group()
@@ -323,12 +426,11 @@ class SugarBase:
                 ['--env-file', self.service_group['env-file']]
             )
 
-        config_path = []
         backend_path_arg = self.service_group['config-path']
         if isinstance(backend_path_arg, str):
-            config_path.append(backend_path_arg)
+            config_path = [backend_path_arg]
         elif isinstance(backend_path_arg, list):
-            config_path.extend(backend_path_arg)
+            config_path = backend_path_arg
         else:
             SugarLogs.raise_error(
                 'The attribute config-path` just supports the data '
@@ -337,8 +439,10 @@ class SugarBase:
                 SugarError.SUGAR_INVALID_CONFIGURATION,
             )
 
-        for p in config_path:
-            self.backend_args.extend(['--file', p])
+        # note: all the `--file` args are added in a single pass
+        self.backend_args.extend(
+            [arg for p in config_path for arg in ('--file', p)]
+        )
 
         if self.service_group.get('project-name'):
             self.backend_args.extend(
@@ -347,18 +451,27 @@ class SugarBase:
 
     def _load_defaults(self) -> None:
         _defaults = self.config.get('defaults', {})
+        self.defaults = _defaults
+
+        if not _defaults:
+            return
+
+        import yaml
+
+        template_env = get_template_env()
 
         for k, v in _defaults.items():
             unescaped_value = v if isinstance(v, str) else str(v)
 
-            _defaults[k] = yaml.safe_load(
-                TEMPLATE.from_string(unescaped_value).render(env=self.env)
+            _defaults[k] = yaml.load(  # nosec B506
+                template_env.from_string(unescaped_value).render(env=self.env),
+                Loader=get_yaml_loader(),
             )
 
-        self.defaults = _defaults
-
     def _load_env(self) -> None:
-        self.env = dict(os.environ)
+        # snapshot reused by all the backend and hook calls
+        self.backend_env = dict(os.environ)
+        self.env = dict(self.backend_env)
 
         env_file = self.config.get('env-file', '')
 
@@ -368,13 +481,15 @@ class SugarBase:
         if not env_file.startswith('/'):
             # use .sugar file as reference for the working
             # directory for the .env file
-            env_file = str(Path(self.file).parent / env_file)
+            env_file = os.path.join(os.path.dirname(self.file), env_file)
 
-        if not Path(env_file).exists():
+        if not os.path.exists(env_file):
             SugarLogs.raise_error(
                 'The given env-file was not found.',
                 SugarError.SUGAR_INVALID_CONFIGURATION,
             )
+        import dotenv
+
         self.env.update(dotenv.dotenv_values(env_file))  # type: ignore
 
     def _get_list_args(self, args: str) -> list[str]:
@@ -393,32 +508,22 @@ class SugarBase:
             # the command doesn't specify services (e.g. version)
             return []
 
-        _arg_services = kwargs.get('services', '')
-        _arg_all = kwargs.get('all', False)
+        if kwargs.get('all', False):
+            return list(self.service_names)
 
-        services_config = self.service_group['services']
-        service_names: list[str] = []
-        services_default = services_config.get('default', '')
+        arg_services: str = kwargs.get('services', '')
+        if arg_services:
+            return arg_services.split(',')
 
-        if _arg_all:
-            service_names = [
-                service['name']
-                for service in self.service_group.get('services', {}).get(
-                    'available', []
-                )
-            ]
-        elif _arg_services:
-            service_names = _arg_services.split(',')
-        elif services_default:
-            service_names = services_default.split(',')
-        else:
-            SugarLogs.raise_error(
-                'If you want to execute the operation for all services, '
-                'use --all parameter.',
-                SugarError.SUGAR_INVALID_PARAMETER,
-            )
+        services_default: str = self.service_group['services'].get('default')
+        if services_default:
+            return services_default.split(',')
 
-        return service_names
+        SugarLogs.raise_error(
+            'If you want to execute the operation for all services, '
+            'use --all parameter.',
+            SugarError.SUGAR_INVALID_PARAMETER,
+        )
 
     def _validate_config(self) -> None:
         """
@@ -428,6 +533,8 @@ class SugarBase:
         ------
             SugarError: If the configuration does not conform to the schema.
         """
+        from jsonschema import ValidationError, validate
+
         try:
             with open(SUGAR_CURRENT_PATH / 'schema.json', 'r') as schema_file:
                 schema = json.load(schema_file)
@@ -445,9 +552,6 @@ class SugarBase:
             SugarLogs.raise_error(
                 error_message, SugarError.CONFIG_VALIDATION_ERROR
             )
-        except yaml.YAMLError as ye:
-            error_message = f'YAML parsing error: {ye}'
-            SugarLogs.raise_error(error_message, SugarError.YAML_PARSING_ERROR)
         except json.JSONDecodeError as je:
             error_message = f'JSON schema decoding error: {je}'
             SugarLogs.raise_error(
@@ -467,12 +571,6 @@ class SugarBase:
             )
 
     def _verify_config(self) -> None:
-        if not self._check_config_file():
-            SugarLogs.raise_error(
-                'Config file .sugar.yaml not found.',
-                SugarError.SUGAR_INVALID_CONFIGURATION,
-            )
-
         if not len(self.config.get('groups', {})):
             SugarLogs.raise_error(
                 'No service groups found.',
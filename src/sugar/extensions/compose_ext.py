@@ -7,19 +7,46 @@ from sugar.extensions.compose import (
     SugarCompose,
     doc_common_services,
 )
+from sugar.logs import SugarError, SugarLogs
+
+doc_hard = {
+    'hard': (
+        'Run compose stop + up instead of compose restart, '
+        'so changes in the services configuration are applied.'
+    )
+}
+doc_restart_options = {
+    'options': (
+        'Specify the options for the compose up call, it requires `--hard`. '
+        'E.g.: `--hard --options -d`.'
+    )
+}
 
 
 class SugarComposeExt(SugarCompose):
     """SugarComposeExt provides extra commands on top of docker-compose."""
 
-    @docparams(doc_common_services)
+    @docparams({**doc_common_services, **doc_hard, **doc_restart_options})
     def _cmd_restart(
         self,
         services: str = '',
         all: bool = False,
         options: str = '',
+        hard: bool = False,
     ) -> None:
-        """Restart services (compose stop + up)."""
+        """Restart services (compose restart, or stop + up with --hard)."""
+        if not hard:
+            # note: the options are given to `up` (e.g. `-d`), most of them
+            #       are not valid for `compose restart`
+            if options:
+                SugarLogs.raise_error(
+                    'The parameter --options requires --hard for restart.',
+                    SugarError.SUGAR_INVALID_PARAMETER,
+                )
+            # a single backend call instead of two
+            super()._cmd_restart(services=services, all=all)
+            return
+
         self._cmd_stop(services=services, all=all)
         self._cmd_start(services=services, all=all, options=options)
 
@@ -2,11 +2,8 @@
 
 from __future__ import annotations
 
-import os
-
 from enum import Enum
-
-from colorama import Fore
+from typing import NoReturn
 
 
 class SugarError(Enum):
@@ -28,6 +25,10 @@ class SugarError(Enum):
     CONFIG_VALIDATION_UNEXPECTED_ERROR = 14
 
 
+class SugarExit(SystemExit):
+    """SugarExit stops the execution with the code of a SugarError."""
+
+
 class SugarLogs:
     """SugarLogs is responsible for handling system messages."""
 
@@ -35,17 +36,23 @@ class SugarLogs:
     def raise_error(
         message: str,
         message_type: SugarError = SugarError.SH_ERROR_RETURN_CODE,
-    ) -> None:
+    ) -> NoReturn:
         """Print error message and exit with given error code."""
+        from colorama import Fore
+
         print(Fore.RED, f'[EE] {message}', Fore.RESET)
-        os._exit(message_type.value)
+        raise SugarExit(message_type.value)
 
     @staticmethod
     def print_info(message: str) -> None:
         """Print info message."""
+        from colorama import Fore
+
         print(Fore.BLUE, message, Fore.RESET)
 
     @staticmethod
     def print_warning(message: str) -> None:
         """Print warning message."""
+        from colorama import Fore
+
         print(Fore.YELLOW, message, Fore.RESET)
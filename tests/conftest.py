@@ -1 +1,11 @@
 """Configuration fixtures for tests."""
+
+import pytest
+
+from sugar.extensions import base
+
+
+@pytest.fixture(autouse=True)
+def config_cache() -> None:
+    """Keep the parsed config cache isolated for each test."""
+    base._config_cache.clear()
@@ -0,0 +1,36 @@
+"""Tests for the sugar CLI."""
+
+import sys
+
+import pytest
+
+from sugar import cli
+
+
+def test_run_app_registers_groups_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test running the app again doesn't register the groups again."""
+    monkeypatch.setattr(sys, 'argv', ['sugar', '--help'])
+
+    for _ in range(2):
+        with pytest.raises(SystemExit):
+            cli.run_app()
+
+    group_names = [group.name for group in cli.app.registered_groups]
+
+    assert len(group_names) == len(set(group_names))
+
+
+def test_extract_root_config_current_argv(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the root config is read from the current `sys.argv`."""
+    monkeypatch.setattr(
+        sys, 'argv', ['sugar', '--file', 'other.yaml', '--verbose', 'compose']
+    )
+
+    root_config = cli.extract_root_config()
+
+    assert root_config['file'] == 'other.yaml'
+    assert root_config['verbose'] is True
@@ -22,10 +22,6 @@ COMPOSE = extensions['compose']()
 COMPOSE_EXT = extensions['compose-ext']()
 STATS = extensions['stats']()
 
-COMPOSE.load(**SUGAR_ARGS)  # type: ignore
-COMPOSE_EXT.load(**SUGAR_ARGS)  # type: ignore
-STATS.load(**SUGAR_ARGS)  # type: ignore
-
 
 @pytest.mark.parametrize(
     'ext,action,args',
@@ -42,4 +38,5 @@ STATS.load(**SUGAR_ARGS)  # type: ignore
 )
 def test_success(ext: SugarBase, action: str, args: dict[str, Any]) -> None:
     """Test success cases."""
+    ext.load(**SUGAR_ARGS)  # type: ignore
     getattr(ext, f'_cmd_{action}')(**args)
@@ -0,0 +1,93 @@
+"""Tests for the SugarBase helpers."""
+
+import os
+import re
+import signal
+import sys
+import threading
+
+from pathlib import Path
+
+import pytest
+import sh
+
+from pytest import CaptureFixture
+from sugar.extensions.base import read_config_file
+from sugar.extensions.compose import SugarCompose
+from sugar.logs import SugarError, SugarExit
+
+
+def test_read_config_file_cache(tmp_path: Path) -> None:
+    """Test the parsed config is cached until the file changes."""
+    config_file = tmp_path / '.sugar.yaml'
+    config_file.write_text('backend: compose\n')
+
+    config = read_config_file(str(config_file))
+    config['backend'] = 'changed'
+
+    assert read_config_file(str(config_file)) == {'backend': 'compose'}
+
+    config_file.write_text('backend: compose\nenv-file: .env\n')
+
+    assert read_config_file(str(config_file)) == {
+        'backend': 'compose',
+        'env-file': '.env',
+    }
+
+
+def test_read_config_file_interned_keys(tmp_path: Path) -> None:
+    """Test the keys of the parsed config are interned."""
+    config_file = tmp_path / '.sugar.yaml'
+    config_file.write_text('services:\n  available:\n    - name: service1\n')
+
+    config = read_config_file(str(config_file))
+    service = config['services']['available'][0]
+
+    assert next(iter(service)) is sys.intern('name')
+
+
+def test_load_config_file_not_found(tmp_path: Path) -> None:
+    """Test the error when the config file doesn't exist."""
+    sugar_ext = SugarCompose()
+
+    with pytest.raises(SugarExit) as exc_info:
+        sugar_ext.load(file=str(tmp_path / '.sugar.yaml'))
+
+    assert exc_info.value.code == SugarError.SUGAR_CONFIG_FILE_NOT_FOUND.value
+
+
+def test_load_twice_backend_args() -> None:
+    """Test loading the config again doesn't accumulate backend args."""
+    config_file = Path(__file__).parent / 'containers' / '.services.sugar.yaml'
+    sugar_ext = SugarCompose()
+
+    sugar_ext.load(file=str(config_file))
+    backend_args = list(sugar_ext.backend_args)
+    sugar_ext.load(file=str(config_file))
+
+    assert sugar_ext.backend_args == backend_args
+
+
+def test_call_backend_app_interrupted(capsys: CaptureFixture[str]) -> None:
+    """Test the backend process is killed when sugar is interrupted."""
+    config_file = Path(__file__).parent / 'containers' / '.services.sugar.yaml'
+    sugar_ext = SugarCompose()
+    sugar_ext.load(file=str(config_file))
+    sugar_ext.backend_app = sh.Command('sleep')
+    sugar_ext.backend_args = []
+
+    # note: it simulates a SIGINT sent just to the sugar process
+    timer = threading.Timer(0.5, os.kill, args=(os.getpid(), signal.SIGINT))
+    timer.start()
+
+    with pytest.raises(SugarExit) as exc_info:
+        sugar_ext._call_backend_app('30')
+    timer.cancel()
+
+    assert exc_info.value.code == SugarError.SH_KEYBOARD_INTERRUPT.value
+
+    match = re.search(r'Process (\d+) killed', capsys.readouterr().out)
+    assert match
+
+    with pytest.raises(ProcessLookupError):
+        os.kill(int(match.group(1)), 0)
@@ -6,6 +6,7 @@ import pytest
 
 from pytest import CaptureFixture
 from sugar.extensions.compose_ext import SugarComposeExt
+from sugar.logs import SugarError, SugarExit
 
 
 @pytest.fixture
@@ -25,9 +26,9 @@ def test_cmd_start_all(
     sugar_ext: SugarComposeExt, capsys: CaptureFixture[str]
 ) -> None:
     """Test start command with all argument."""
-    sugar_ext._cmd_restart(services='', all=True, options='-d')
+    sugar_ext._cmd_start(services='', all=True, options='-d')
     captured = capsys.readouterr()
-    for term in 'docker compose up service1-1 service1-2'.split(' '):
+    for term in 'docker compose up -d service1-1 service1-2'.split(' '):
         assert term in captured.out
 
 
@@ -35,10 +36,41 @@ def test_cmd_restart_all(
     sugar_ext: SugarComposeExt, capsys: CaptureFixture[str]
 ) -> None:
     """Test restart command with all argument."""
-    sugar_ext._cmd_restart(services='', all=True, options='-d')
+    sugar_ext._cmd_restart(services='', all=True)
+    captured = capsys.readouterr()
+    for term in 'docker compose restart service1-1 service1-2'.split(' '):
+        assert term in captured.out
+    assert ' stop ' not in captured.out
+
+
+def test_cmd_restart_options_without_hard(
+    sugar_ext: SugarComposeExt, capsys: CaptureFixture[str]
+) -> None:
+    """Test restart command options are rejected without hard."""
+    with pytest.raises(SugarExit) as exc_info:
+        sugar_ext._cmd_restart(services='', all=True, options='-d')
+
+    assert exc_info.value.code == SugarError.SUGAR_INVALID_PARAMETER.value
+    assert 'docker compose restart' not in capsys.readouterr().out
+
+
+def test_cmd_restart_hard_all(
+    sugar_ext: SugarComposeExt, capsys: CaptureFixture[str]
+) -> None:
+    """Test restart command with hard and all arguments."""
+    sugar_ext._cmd_restart(services='', all=True, options='-d', hard=True)
     captured = capsys.readouterr()
     for term in 'docker compose stop service1-1 service1-2'.split(' '):
         assert term in captured.out
 
-    for term in 'docker compose up service1-1 service1-2'.split(' '):
+    for term in 'docker compose up -d service1-1 service1-2'.split(' '):
         assert term in captured.out
+
+
+def test_actions_dispatch() -> None:
+    """Test overridden commands are not registered twice."""
+    assert SugarComposeExt.actions.count('restart') == 1
+    assert (
+        SugarComposeExt.actions_dispatch['restart']
+        is SugarComposeExt._cmd_restart
+    )